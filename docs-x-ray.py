@@ -2,62 +2,148 @@
 # GitHub: https://github.com/San-Tus/Docs-X-Ray
 """Docs X-Ray - A tool to scan documents for sensitive information."""
 
+import codecs
+import importlib.util
+import os
 import sys
 from pathlib import Path
-from colorama import Fore, Style, init
 
+from modules.cache import default_cache_path
 from modules.cli import parse_arguments
+from modules.file_extractors import iter_supported_files
+from modules.matchers import load_automaton, resolve_engine
 from modules.scanners import scan_folder
+from modules.utils import C, setup_logging
 
-# Set UTF-8 encoding for console output on Windows
-if sys.platform == 'win32':
+# Directory holding the sensitive word lists (symlinks are not resolved)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Console message templates, built once from the color codes
+_ERROR = f"{C.RED}{{}}{C.RESET_ALL}"
+_HINT = f"{C.YELLOW}{{}}{C.RESET_ALL}"
+_LIST_INFO = f"{C.GREEN}Using sensitivity list: {C.BRIGHT}{{}}{C.RESET_ALL} ({{}})"
+_OPTION_INFO = f"{C.CYAN}{{}}: {C.BRIGHT}{{}}{C.RESET_ALL}{{}}"
+
+
+def _is_utf8(stream) -> bool:
+    """Check whether a text stream already encodes as UTF-8."""
     try:
-        sys.stdout.reconfigure(encoding='utf-8')
-        sys.stderr.reconfigure(encoding='utf-8')
+        return codecs.lookup(getattr(stream, 'encoding', None) or 'ascii').name == 'utf-8'
+    except LookupError:
+        return False
+
+
+def _ensure_utf8():
+    """Set UTF-8 encoding for console output on Windows.
+
+    Streams that are already UTF-8 (e.g. Windows Terminal, or PYTHONIOENCODING
+    set by the caller) are left untouched.
+    """
+    if sys.platform != 'win32' or (_is_utf8(sys.stdout) and _is_utf8(sys.stderr)):
+        return
+    try:
+        for stream in (sys.stdout, sys.stderr):
+            if not _is_utf8(stream):
+                stream.reconfigure(encoding='utf-8')
     except AttributeError:
         # Python < 3.7
-        import codecs
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
-# Initialize colorama for Windows color support
-init(autoreset=True)
+
+def _run_profiled(profiler: str, func, **kwargs):
+    """Run func with the requested profiler ('none', 'cprofile' or 'pyinstrument') and print its report."""
+    if profiler == 'cprofile':
+        import cProfile
+        import pstats
+
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func, **kwargs)
+        finally:
+            print(f"\n{C.CYAN}{C.BRIGHT}PROFILE (cProfile, top 30 by cumulative time){C.RESET_ALL}")
+            pstats.Stats(profile, stream=sys.stdout).sort_stats('cumulative').print_stats(30)
+
+    if profiler == 'pyinstrument':
+        from pyinstrument import Profiler
+
+        profile = Profiler()
+        profile.start()
+        try:
+            return func(**kwargs)
+        finally:
+            profile.stop()
+            print(profile.output_text(unicode=True, color=bool(C.RESET_ALL)))
+
+    return func(**kwargs)
 
 
 def main():
     """Main entry point for Docs X-Ray."""
     # Parse command-line arguments
     config = parse_arguments()
+    _ensure_utf8()
+    setup_logging()
+
+    if config.profile == 'pyinstrument' and importlib.util.find_spec('pyinstrument') is None:
+        sys.stdout.write(_ERROR.format("Profiling with pyinstrument requires: pip install pyinstrument") + "\n")
+        return
+
+    try:
+        engine = resolve_engine(config.engine)
+    except ImportError as e:
+        sys.stdout.write(_ERROR.format(e) + "\n")
+        return
 
     # Locate sensitive words file
-    script_dir = Path(__file__).resolve().parent
-    sensitive_words_file = script_dir / f"sensitive_words_{config['sensitivity_list']}.json"
+    sensitive_words_file = Path(_SCRIPT_DIR, f"sensitive_words_{config.sensitivity_list}.json")
 
-    if not sensitive_words_file.is_file():
-        print(f"{Fore.RED}Sensitive words file not found: {sensitive_words_file}{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Please ensure the file exists in the script directory.{Style.RESET_ALL}")
+    try:
+        sensitive_words_stat = os.stat(sensitive_words_file)
+    except FileNotFoundError:
+        sys.stdout.write(_ERROR.format(f"Sensitive words file not found: {sensitive_words_file}") + "\n"
+                         + _HINT.format("Please ensure the file exists in the script directory.") + "\n")
         return
 
-    # Print configuration info
-    print(f"{Fore.GREEN}Using sensitivity list: {Style.BRIGHT}{config['sensitivity_list'].upper()}{Style.RESET_ALL} ({sensitive_words_file.name})")
-    if config['recursive']:
-        print(f"{Fore.CYAN}Recursive mode: {Style.BRIGHT}ENABLED{Style.RESET_ALL} - scanning all subdirectories")
-    if config['case_sensitive']:
-        print(f"{Fore.CYAN}Case-sensitive matching: {Style.BRIGHT}ENABLED{Style.RESET_ALL}")
-    if config['output_dir']:
-        print(f"{Fore.CYAN}Output directory: {Style.BRIGHT}{config['output_dir']}{Style.RESET_ALL}")
-
-    # Run the scan
-    scan_folder(
-        folder=config['folder'],
+    # Print configuration info in a single write
+    lines = [_LIST_INFO.format(config.sensitivity_list.upper(), sensitive_words_file.name)]
+    if config.recursive:
+        lines.append(_OPTION_INFO.format("Recursive mode", "ENABLED", " - scanning all subdirectories"))
+    if config.case_sensitive:
+        lines.append(_OPTION_INFO.format("Case-sensitive matching", "ENABLED", ""))
+    if config.fast:
+        lines.append(_OPTION_INFO.format("Fast mode", "ENABLED", " - stopping at the first page with findings"))
+    if config.use_cache:
+        lines.append(_OPTION_INFO.format("Extraction cache", "ENABLED", f" - {default_cache_path()}"))
+    if config.engine != 'auto':
+        lines.append(_OPTION_INFO.format("Matching engine", engine, ""))
+    if config.output_dir:
+        lines.append(_OPTION_INFO.format("Output directory", config.output_dir, ""))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    # Load the word list automaton, rebuilt only when the JSON file changes. scan_folder picks it up
+    # again from load_automaton's memo, so spawned workers can still load it from the on-disk cache
+    load_automaton(sensitive_words_file, case_sensitive=config.case_sensitive,
+                   json_stat=sensitive_words_stat, engine=engine)
+
+    # Run the scan over a single scandir walk of the folder
+    _run_profiled(
+        config.profile,
+        scan_folder,
+        folder=config.folder,
         sensitive_json=sensitive_words_file,
-        sensitivity_list=config['sensitivity_list'],
-        generate_html=config['generate_html'],
-        report_lang=config['report_lang'],
-        recursive=config['recursive'],
-        output_formats=config['output_formats'],
-        output_dir=config['output_dir'],
-        case_sensitive=config['case_sensitive']
+        engine=engine,
+        files=iter_supported_files(config.folder, recursive=config.recursive),
+        sensitivity_list=config.sensitivity_list,
+        generate_html=config.generate_html,
+        report_lang=config.report_lang,
+        recursive=config.recursive,
+        output_formats=config.output_formats,
+        output_dir=config.output_dir,
+        case_sensitive=config.case_sensitive,
+        jobs=config.jobs,
+        fast=config.fast,
+        cache_path=default_cache_path() if config.use_cache else None
     )
 
 
@@ -2,32 +2,69 @@
 Docs X-Ray modules.
 
 This package contains all the modular components for document scanning:
+- cache: On-disk cache of extracted file text
 - cli: Command-line interface and argument parsing
 - constants: Configuration constants (file extensions, etc.)
 - file_extractors: Text extraction from various file formats
 - scanners: Sensitive word scanning logic
+- matchers: Compiled word list matchers (Aho-Corasick automaton or Hyperscan database)
 - exporters: Export functionality (CSV, XLSX, JSON)
 - html_reporting: HTML report generation
 - utils: Utility functions (warning suppression, etc.)
 - svg_icons: SVG icons for HTML reports
 """
 
-from .cli import parse_arguments, create_parser
-from .constants import SUPPORTED_EXTENSIONS
-from .file_extractors import extract_text_from_file
-from .scanners import scan_folder, load_sensitive_words
-from .exporters import export_statistics_csv, export_statistics_xlsx, export_statistics_json
-from .html_reporting import generate_html_report
-from .utils import suppress_warnings_and_stderr, suppress_pdf_warnings
-from .svg_icons import get_category_icon, get_status_icon, get_all_categories
+from importlib import import_module
+
+# Submodule of every public name, imported on first access (PEP 562), so importing
+# one submodule (e.g. modules.cli) does not load the exporters and report generator
+_EXPORTS = {
+    'ExtractCache': 'cache',
+    'default_cache_path': 'cache',
+    'parse_arguments': 'cli',
+    'create_parser': 'cli',
+    'SUPPORTED_EXTENSIONS': 'constants',
+    'SUPPORTED_EXTENSION_SET': 'constants',
+    'extract_text_from_file': 'file_extractors',
+    'scan_folder': 'scanners',
+    'load_sensitive_words': 'scanners',
+    'build_automaton': 'matchers',
+    'load_automaton': 'matchers',
+    'resolve_engine': 'matchers',
+    'export_statistics_csv': 'exporters',
+    'export_statistics_xlsx': 'exporters',
+    'export_statistics_json': 'exporters',
+    'generate_html_report': 'html_reporting',
+    'suppress_warnings_and_stderr': 'utils',
+    'suppress_pdf_warnings': 'utils',
+    'get_category_icon': 'svg_icons',
+    'get_status_icon': 'svg_icons',
+    'get_all_categories': 'svg_icons',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    'ExtractCache',
+    'default_cache_path',
     'parse_arguments',
     'create_parser',
     'SUPPORTED_EXTENSIONS',
+    'SUPPORTED_EXTENSION_SET',
     'extract_text_from_file',
     'scan_folder',
     'load_sensitive_words',
+    'build_automaton',
+    'load_automaton',
+    'resolve_engine',
     'export_statistics_csv',
     'export_statistics_xlsx',
     'export_statistics_json',
@@ -0,0 +1,120 @@
+"""
+On-disk cache of extracted page texts, so unchanged files are not parsed again on re-runs.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import zlib
+from pathlib import Path
+
+
+def default_cache_path() -> Path:
+    """Get the default location of the extraction cache database."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(cache_home, 'docs-x-ray', 'extracts.db')
+
+
+class _ExtractionErrorCounter(logging.Handler):
+    """Count the warnings and errors logged by the extractors, i.e. files they could not read."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+# Extractors log a failure and yield no (or partial) pages, the cache must not keep those
+_extraction_errors = _ExtractionErrorCounter()
+logging.getLogger(f"{__package__}.file_extractors").addHandler(_extraction_errors)
+
+
+class ExtractCache:
+    """SQLite cache of the pages extracted from each file, keyed by (path, mtime, size).
+
+    A file whose modification time or size changed is extracted again and its
+    entry replaced. The database holds the plain text of every cached file,
+    so it is only readable by its owner. version identifies the extractors'
+    output, a database written with another version is emptied on first use.
+    Every process opens its own connection on first use, so the cache can be
+    passed to worker processes; SQLite serializes their writes.
+    """
+
+    def __init__(self, path: Path, version: int = 0):
+        self.path = Path(path)
+        self.version = version
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        # Connections cannot be pickled, workers open their own
+        return {'path': self.path, 'version': self.version}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['version'])
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database of this process, creating it on first use."""
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Create the database owner-only before SQLite opens it, its WAL files get the same mode
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            if connection.execute('PRAGMA user_version').fetchone()[0] != self.version:
+                # Pages extracted by other extractor versions may differ from what they extract now
+                connection.execute('DROP TABLE IF EXISTS extracts')
+                connection.execute(f'PRAGMA user_version = {int(self.version)}')
+            connection.execute('CREATE TABLE IF NOT EXISTS extracts '
+                               '(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, pages BLOB)')
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get_or_extract(self, file_path: Path, extractor):
+        """Get the cached pages of file_path, or extract them with extractor(file_path).
+
+        Returns an iterable of page texts like extractor does. Freshly
+        extracted pages are stored once the caller has consumed all of them,
+        so a scan stopping early (e.g. in fast mode) never caches partial text.
+        Files the extractor could not read (it logged a warning or error) are
+        never stored, so the next run reports the failure again.
+        """
+        try:
+            stat = os.stat(file_path)
+            key = os.path.abspath(file_path)
+            row = self._connect().execute('SELECT mtime_ns, size, pages FROM extracts WHERE path = ?',
+                                          (key,)).fetchone()
+        except (OSError, sqlite3.Error):
+            # Unreadable file or unusable cache location - extract without caching
+            return extractor(file_path)
+
+        if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            try:
+                return pickle.loads(zlib.decompress(row[2]))
+            except (zlib.error, pickle.UnpicklingError, EOFError):
+                # Corrupt entry - extract the file again below
+                pass
+        # Extractors returning a list have already logged any failure when they return
+        errors = _extraction_errors.count
+        return self._record(key, stat, extractor(file_path), errors)
+
+    def _record(self, key: str, stat: os.stat_result, pages, errors: int):
+        """Yield pages while collecting them, then store them under key unless extraction logged errors."""
+        collected = []
+        for page in pages:
+            collected.append(page)
+            yield page
+
+        if _extraction_errors.count != errors:
+            return
+        data = zlib.compress(pickle.dumps(collected, pickle.HIGHEST_PROTOCOL))
+        try:
+            self._connect().execute('INSERT OR REPLACE INTO extracts VALUES (?, ?, ?, ?)',
+                                    (key, stat.st_mtime_ns, stat.st_size, data))
+        except sqlite3.Error:
+            # Locked or read-only database - the next run simply extracts the file again
+            pass
@@ -4,8 +4,11 @@ Enhanced argument parsing with better help text and examples.
 """
 
 import argparse
+import os
+import sys
 import textwrap
 from pathlib import Path
+from types import SimpleNamespace
 
 
 VERSION = "1.0.0"
@@ -41,9 +44,18 @@ def create_parser():
       Generate all export formats with custom output directory:
         python docs-x-ray.py -d ./documents -o all -O ./reports
 
+      Recursive scan using 4 worker processes:
+        python docs-x-ray.py -d ./documents -r -j 4
+
+      Quickly list which files contain sensitive terms:
+        python docs-x-ray.py -d ./documents -r --fast --no-html
+
       Case-sensitive scan without HTML report:
         python docs-x-ray.py -d ./code -c --no-html
 
+      Find out where the scan spends its time:
+        python docs-x-ray.py -d ./documents -j 1 --profile cprofile
+
       Generate Czech language HTML report:
         python docs-x-ray.py -d ./docs -s cz -l cz -o xlsx
 
@@ -115,6 +127,36 @@ def create_parser():
         action="store_true",
         help="Recursively scan all subdirectories"
     )
+    scanning.add_argument(
+        "-j",
+        "--jobs",
+        "--workers",
+        dest="jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Number of worker processes scanning files in parallel [default: number of CPUs]"
+    )
+    scanning.add_argument(
+        "--fast",
+        action="store_true",
+        help="Stop scanning each file at its first page with findings "
+             "(enough to tell which files contain sensitive terms)"
+    )
+    scanning.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the extracted text of scanned files in ~/.cache/docs-x-ray/extracts.db, so unchanged files "
+             "are not parsed again on later runs (the cache holds the plain text of every scanned file)"
+    )
+    scanning.add_argument(
+        "--engine",
+        choices=["auto", "ahocorasick", "hyperscan"],
+        default="auto",
+        metavar="ENGINE",
+        help="Matching engine: 'ahocorasick', 'hyperscan' (requires: pip install hyperscan), "
+             "or 'auto' for hyperscan when installed [default: auto]"
+    )
 
     # Output options
     output = parser.add_argument_group('OUTPUT OPTIONS')
@@ -137,12 +179,23 @@ def create_parser():
         help="Output directory for reports and statistics [default: script directory]"
     )
 
+    # Diagnostic options
+    diagnostics = parser.add_argument_group('DIAGNOSTIC OPTIONS')
+    diagnostics.add_argument(
+        "--profile",
+        choices=["none", "cprofile", "pyinstrument"],
+        default="none",
+        metavar="PROFILER",
+        help="Profile the scan with 'cprofile' or 'pyinstrument' and print the report; "
+             "combine with -j 1 to profile extraction and matching [default: none]"
+    )
+
 
     return parser
 
 
 def parse_arguments():
-    """Parse and validate command-line arguments."""
+    """Parse and validate command-line arguments into a config namespace."""
     parser = create_parser()
     args = parser.parse_args()
 
@@ -151,6 +204,10 @@ def parse_arguments():
     if not folder_to_scan.is_dir():
         parser.error(f"Directory not found: {folder_to_scan}")
 
+    # Validate number of jobs
+    if args.jobs < 1:
+        parser.error(f"Number of jobs must be at least 1: {args.jobs}")
+
     # Parse output formats
     output_formats = None
     if args.output_format:
@@ -164,13 +221,19 @@ def parse_arguments():
     if args.output_dir:
         output_dir = Path(args.output_dir).expanduser()
 
-    return {
-        'folder': folder_to_scan,
-        'sensitivity_list': args.sensitivity_list,
-        'report_lang': args.lang,
-        'recursive': args.recursive,
-        'generate_html': not args.no_html,
-        'output_formats': output_formats,
-        'output_dir': output_dir,
-        'case_sensitive': args.case_sensitive
-    }
+    return SimpleNamespace(
+        folder=folder_to_scan,
+        # Interned, these strings are reused in every file name and report lookup
+        sensitivity_list=sys.intern(args.sensitivity_list),
+        report_lang=sys.intern(args.lang),
+        recursive=args.recursive,
+        generate_html=not args.no_html,
+        output_formats=output_formats,
+        output_dir=output_dir,
+        case_sensitive=args.case_sensitive,
+        jobs=args.jobs,
+        fast=args.fast,
+        use_cache=args.cache,
+        engine=args.engine,
+        profile=args.profile
+    )
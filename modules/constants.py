@@ -2,6 +2,8 @@
 Constants and configuration for Docs X-Ray.
 """
 
+import sys
+
 # Supported file extensions
 SUPPORTED_EXTENSIONS = [
     # Documents
@@ -27,3 +29,20 @@ SUPPORTED_EXTENSIONS = [
     '.gitignore', '.gitattributes', '.editorconfig', '.htaccess', '.npmrc', '.babelrc', '.eslintrc',
     '.prettierrc', '.stylelintrc', '.jshintrc', '.ansible', '.terraform', '.tf', '.tfvars'
 ]
+
+# Interned set of the supported extensions for O(1) lookups while walking folders
+SUPPORTED_EXTENSION_SET = frozenset(map(sys.intern, SUPPORTED_EXTENSIONS))
+
+# Extensions read as plain text (programming, config, markup files)
+TEXT_EXTENSIONS = frozenset(map(sys.intern, [
+    '.txt', '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', '.hpp',
+    '.cs', '.php', '.rb', '.go', '.rs', '.swift', '.kt', '.scala', '.r', '.m', '.lua',
+    '.pl', '.sh', '.bash', '.zsh', '.fish', '.ps1', '.html', '.htm', '.css', '.scss',
+    '.sass', '.less', '.vue', '.svelte', '.json', '.yaml', '.yml', '.toml', '.ini',
+    '.cfg', '.conf', '.config', '.properties', '.env', '.xml', '.md', '.markdown',
+    '.rst', '.tex', '.csv', '.tsv', '.gradle', '.maven', '.sbt', '.rake', '.make',
+    '.cmake', '.dockerfile', '.dockerignore', '.containerfile', '.gitlab-ci.yml',
+    '.travis.yml', '.circleci', '.gitignore', '.gitattributes', '.editorconfig',
+    '.htaccess', '.npmrc', '.babelrc', '.eslintrc', '.prettierrc', '.stylelintrc',
+    '.jshintrc', '.ansible', '.terraform', '.tf', '.tfvars'
+]))
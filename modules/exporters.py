@@ -6,24 +6,44 @@ import csv
 import json
 from pathlib import Path
 from datetime import datetime
-from colorama import Fore, Style
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def export_statistics_csv(stats: dict, output_path: Path, total_files: int, files_with_hits: int, total_matches: int):
-    """Export statistics to CSV format."""
+from .utils import C, sort_statistics
+
+# xlsxwriter streams the workbook straight to XML, terms are always written as text.
+# constant_memory flushes every finished row to disk (like openpyxl's write-only mode),
+# so rows must be written top to bottom
+_XLSX_OPTIONS = {'strings_to_formulas': False, 'strings_to_urls': False, 'constant_memory': True}
+
+# XLSX cell styles, registered with each workbook through add_format
+_XLSX_HEADER_STYLE = {'bg_color': '#366092', 'font_color': '#FFFFFF', 'bold': True, 'align': 'center'}
+_XLSX_LABEL_STYLE = {'bold': True}
+
+# Column headers of the occurrence tables in the CSV and XLSX exports
+_HEADERS = ('Category', 'Sensitive Term', 'Total Occurrences')
+
+
+def export_statistics_csv(stats: dict, output_path: Path, total_files: int, files_with_hits: int, total_matches: int,
+                          sorted_stats: list = None):
+    """Export statistics to CSV format.
+
+    Pass sorted_stats from sort_statistics to skip sorting stats again.
+    """
+    if sorted_stats is None:
+        sorted_stats = sort_statistics(stats)
     try:
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
 
             # Write header
-            writer.writerow(['Category', 'Sensitive Term', 'Total Occurrences'])
+            writer.writerow(_HEADERS)
 
-            # Write data
-            for category, words in sorted(stats.items()):
-                for word, count in sorted(words.items(), key=lambda x: x[1], reverse=True):
-                    writer.writerow([category, word, count])
+            # Write data, iterated by the C writer in a single call
+            writer.writerows((category, word, count) for category, words in sorted_stats for word, count in words)
 
             # Write summary
             writer.writerow([])
@@ -34,91 +54,79 @@ def export_statistics_csv(stats: dict, output_path: Path, total_files: int, file
             writer.writerow(['Unique terms found', sum(len(words) for words in stats.values())])
             writer.writerow(['Categories with findings', len(stats)])
 
-        print(f"{Fore.GREEN}[OK] CSV report exported: {Style.BRIGHT}{output_path}{Style.RESET_ALL}")
+        print(f"{C.GREEN}[OK] CSV report exported: {C.BRIGHT}{output_path}{C.RESET_ALL}")
     except Exception as e:
-        print(f"{Fore.RED}[ERROR] Error exporting CSV: {e}{Style.RESET_ALL}")
+        print(f"{C.RED}[ERROR] Error exporting CSV: {e}{C.RESET_ALL}")
 
 
-def export_statistics_xlsx(stats: dict, output_path: Path, total_files: int, files_with_hits: int, total_matches: int):
-    """Export statistics to XLSX format with formatting in two sheets."""
+def export_statistics_xlsx(stats: dict, output_path: Path, total_files: int, files_with_hits: int, total_matches: int,
+                           sorted_stats: list = None):
+    """Export statistics to XLSX format with formatting in two sheets.
+
+    Pass sorted_stats from sort_statistics to skip sorting stats again.
+    """
+    if sorted_stats is None:
+        sorted_stats = sort_statistics(stats)
     try:
-        wb = openpyxl.Workbook()
+        import xlsxwriter
+
+        wb = xlsxwriter.Workbook(str(output_path), _XLSX_OPTIONS)
 
         # Header formatting
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
+        header_format = wb.add_format(_XLSX_HEADER_STYLE)
 
         # ========== Sheet 1: Occurrences ==========
-        ws_occurrences = wb.active
-        ws_occurrences.title = "Occurrences"
+        ws_occurrences = wb.add_worksheet("Occurrences")
 
         # Write headers for Occurrences sheet
-        headers = ['Category', 'Sensitive Term', 'Total Occurrences']
-        for col, header in enumerate(headers, 1):
-            cell = ws_occurrences.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center')
+        ws_occurrences.write_row(0, 0, _HEADERS, header_format)
 
         # Write data
-        row = 2
-        for category, words in sorted(stats.items()):
-            for word, count in sorted(words.items(), key=lambda x: x[1], reverse=True):
-                ws_occurrences.cell(row=row, column=1, value=category)
-                ws_occurrences.cell(row=row, column=2, value=word)
-                ws_occurrences.cell(row=row, column=3, value=count)
+        row = 1
+        for category, words in sorted_stats:
+            for word, count in words:
+                ws_occurrences.write_row(row, 0, (category, word, count))
                 row += 1
 
         # Adjust column widths
-        ws_occurrences.column_dimensions['A'].width = 25
-        ws_occurrences.column_dimensions['B'].width = 30
-        ws_occurrences.column_dimensions['C'].width = 20
+        ws_occurrences.set_column('A:A', 25)
+        ws_occurrences.set_column('B:B', 30)
+        ws_occurrences.set_column('C:C', 20)
 
         # ========== Sheet 2: Statistics ==========
-        ws_stats = wb.create_sheet(title="Statistics")
+        ws_stats = wb.add_worksheet("Statistics")
 
-        # Summary formatting
-        summary_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-        summary_font = Font(bold=True)
-        label_font = Font(bold=True)
+        # Labels are bold through the column format, so each row is written in one call
+        label_format = wb.add_format(_XLSX_LABEL_STYLE)
+        ws_stats.set_column('A:A', 30, label_format)
+        ws_stats.set_column('B:B', 20)
 
         # Write summary statistics
-        row = 1
+        ws_stats.write_row(0, 0, ('Metric', 'Value'), header_format)
         summary_data = [
-            ['Metric', 'Value'],
-            ['Total files scanned', total_files],
-            ['Files with hits', files_with_hits],
-            ['Total matches found', total_matches],
-            ['Unique terms found', sum(len(words) for words in stats.values())],
-            ['Categories with findings', len(stats)]
+            ('Total files scanned', total_files),
+            ('Files with hits', files_with_hits),
+            ('Total matches found', total_matches),
+            ('Unique terms found', sum(len(words) for words in stats.values())),
+            ('Categories with findings', len(stats))
         ]
+        for idx, row_data in enumerate(summary_data, 1):
+            ws_stats.write_row(idx, 0, row_data)
 
-        for idx, (label, value) in enumerate(summary_data):
-            cell_label = ws_stats.cell(row=row + idx, column=1, value=label)
-            cell_value = ws_stats.cell(row=row + idx, column=2, value=value)
-
-            if idx == 0:  # Header row
-                cell_label.fill = header_fill
-                cell_label.font = header_font
-                cell_label.alignment = Alignment(horizontal='center')
-                cell_value.fill = header_fill
-                cell_value.font = header_font
-                cell_value.alignment = Alignment(horizontal='center')
-            else:
-                cell_label.font = label_font
-
-        # Adjust column widths
-        ws_stats.column_dimensions['A'].width = 30
-        ws_stats.column_dimensions['B'].width = 20
-
-        wb.save(output_path)
-        print(f"{Fore.GREEN}[OK] XLSX report exported: {Style.BRIGHT}{output_path}{Style.RESET_ALL}")
+        wb.close()
+        print(f"{C.GREEN}[OK] XLSX report exported: {C.BRIGHT}{output_path}{C.RESET_ALL}")
     except Exception as e:
-        print(f"{Fore.RED}[ERROR] Error exporting XLSX: {e}{Style.RESET_ALL}")
+        print(f"{C.RED}[ERROR] Error exporting XLSX: {e}{C.RESET_ALL}")
+
 
+def export_statistics_json(stats: dict, output_path: Path, total_files: int, files_with_hits: int, total_matches: int,
+                           file_types: dict, sorted_stats: list = None):
+    """Export statistics to JSON format.
 
-def export_statistics_json(stats: dict, output_path: Path, total_files: int, files_with_hits: int, total_matches: int, file_types: dict):
-    """Export statistics to JSON format."""
+    Pass sorted_stats from sort_statistics to skip sorting stats again.
+    """
+    if sorted_stats is None:
+        sorted_stats = sort_statistics(stats)
     try:
         # Prepare data structure
         export_data = {
@@ -135,17 +143,21 @@ def export_statistics_json(stats: dict, output_path: Path, total_files: int, fil
         }
 
         # Convert stats to JSON-friendly format
-        for category, words in sorted(stats.items()):
+        for category, words in sorted_stats:
             export_data["findings"][category] = []
-            for word, count in sorted(words.items(), key=lambda x: x[1], reverse=True):
+            for word, count in words:
                 export_data["findings"][category].append({
                     "term": word,
                     "occurrences": count
                 })
 
-        with open(output_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dumps(indent=2, ensure_ascii=False), serialized in a single call
+            output_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump would issue one small write per token, serialize first and write once
+            output_path.write_text(json.dumps(export_data, indent=2, ensure_ascii=False), encoding='utf-8')
 
-        print(f"{Fore.GREEN}[OK] JSON report exported: {Style.BRIGHT}{output_path}{Style.RESET_ALL}")
+        print(f"{C.GREEN}[OK] JSON report exported: {C.BRIGHT}{output_path}{C.RESET_ALL}")
     except Exception as e:
-        print(f"{Fore.RED}[ERROR] Error exporting JSON: {e}{Style.RESET_ALL}")
+        print(f"{C.RED}[ERROR] Error exporting JSON: {e}{C.RESET_ALL}")
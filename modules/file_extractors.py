@@ -2,293 +2,481 @@
 File text extraction functions for various document formats.
 """
 
+import codecs
+import importlib
+import io
 import json
+import logging
+import mmap
+import os
+import posixpath
+import sys
+import zipfile
 from pathlib import Path
-from colorama import Fore, Style
-from docx import Document
-import openpyxl
-from pptx import Presentation
 from striprtf.striprtf import rtf_to_text
-from odf import text, teletype
-from odf.opendocument import load as odf_load
-from odf.table import Table, TableRow, TableCell
-from odf.draw import Frame
-import pdfplumber
 
+# The document parsers (lxml, openpyxl, pypdfium2, charset_normalizer) are imported by
+# the extractors that use them, so startup and every spawned worker only load the
+# libraries of the formats actually scanned
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .constants import SUPPORTED_EXTENSION_SET, TEXT_EXTENSIONS
 from .utils import suppress_warnings_and_stderr
 
+logger = logging.getLogger(__name__)
+
+# Version of the extracted text, bump it whenever an extractor's output changes
+# so pages cached by older versions are discarded
+EXTRACTOR_VERSION = 2
+
+# Byte order marks of text files and their codecs, UTF-32 first as its LE mark starts like UTF-16's
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Text files from this size on are memory-mapped instead of read into a bytes object
+_MMAP_MIN_SIZE = 1 << 20
+
+# Office Open XML namespaces and the lxml tag names read from DOCX and PPTX parts
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+_P = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+# OpenDocument namespaces of the lxml tag names read from ODT, ODS and ODP content
+_ODF_OFFICE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}'
+_ODF_TEXT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+_ODF_TABLE = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}'
+_ODF_DRAW = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}'
+
+# ODF elements that separate words: paragraphs, headings, spaces, tabs and line breaks
+_ODF_SEPARATORS = frozenset(_ODF_TEXT + name for name in ('p', 'h', 's', 'tab', 'line-break'))
+
+
+# Interned string of every supported extension, keyed by an equal string
+_INTERNED_EXTENSIONS = {extension: extension for extension in SUPPORTED_EXTENSION_SET}
+
+
+def file_extension(name: str) -> str:
+    """Get the lower-cased extension of a file name, e.g. '.pdf'.
+
+    Unlike Path.suffix, dotfiles such as '.gitignore' keep their name as the
+    extension, so they match the supported extension list.
+
+    Supported extensions are returned as the interned strings of
+    SUPPORTED_EXTENSION_SET, so the per-file copy is dropped right away and
+    later dict lookups (file type counts, extractor dispatch) match by identity.
+    """
+    dot = name.rfind('.')
+    if dot < 0:
+        return ''
+    extension = name[dot:].lower()
+    return _INTERNED_EXTENSIONS.get(extension, extension)
+
+
+def iter_supported_files(folder: Path, recursive: bool = False, extensions=SUPPORTED_EXTENSION_SET):
+    """Yield os.DirEntry objects of all supported files in folder.
+
+    Walks the tree with os.scandir, so file types come from the cached
+    directory entries instead of extra stat() calls per file. Symlinked
+    directories are not followed and unreadable directories are skipped.
+    """
+    if not isinstance(extensions, frozenset):
+        # One shared interned str per extension
+        extensions = frozenset(map(sys.intern, extensions))
+    stack = [folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    if file_extension(entry.name) in extensions and entry.is_file():
+                        yield entry
+        except OSError as e:
+            logger.error("Error reading directory %s: %s", e.filename, e.strerror)
+
+
+def _parse_xml_part(archive: zipfile.ZipFile, name: str):
+    """Parse one XML part of an Office Open XML package with lxml."""
+    from lxml import etree
+
+    # Never expand entities of untrusted documents
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+    with archive.open(name) as part:
+        return etree.parse(part, parser).getroot()
+
+
+def _xml_part_text(root, paragraph_tag: str, text_tag: str, break_tags: tuple) -> str:
+    """Join the text nodes below root, separating paragraphs, tabs and line breaks with spaces.
+
+    Runs of a paragraph are joined without a separator, so words split over
+    several runs (e.g. by spell checking or formatting) stay whole.
+    """
+    pieces = []
+    for element in root.iter(paragraph_tag, text_tag, *break_tags):
+        if element.tag == text_tag:
+            if element.text:
+                pieces.append(element.text)
+        else:
+            pieces.append(" ")
+    return "".join(pieces)
+
 
 def extract_text_from_docx(file_path: Path):
-    """Extract text from DOCX files."""
+    """Extract text from DOCX files, yielding the document as a single page.
+
+    Reads the w:t text nodes of word/document.xml with lxml instead of
+    building python-docx paragraph objects.
+    """
     try:
-        doc = Document(file_path)
-        text_pages = []
-        for para in doc.paragraphs:
-            if para.text.strip():
-                text_pages.append(para.text)
-        return [" ".join(text_pages)]  # Return as single page
+        with zipfile.ZipFile(file_path) as archive:
+            root = _parse_xml_part(archive, 'word/document.xml')
+        text = _xml_part_text(root, _W + 'p', _W + 't', (_W + 'tab', _W + 'br', _W + 'cr'))
+        if text.strip():
+            yield text
     except Exception as e:
-        print(f"{Fore.RED}Error reading DOCX {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+        logger.error("Error reading DOCX %s: %s", file_path.name, e)
 
 
 def extract_text_from_xlsx(file_path: Path):
-    """Extract text from XLSX/XLS files."""
+    """Extract text from XLSX/XLS files, yielding one page per sheet."""
     try:
-        wb = openpyxl.load_workbook(file_path, data_only=True)
-        text_pages = []
-        for sheet in wb.worksheets:
-            sheet_text = []
-            for row in sheet.iter_rows(values_only=True):
-                row_text = " ".join([str(cell) for cell in row if cell is not None])
-                if row_text.strip():
-                    sheet_text.append(row_text)
-            if sheet_text:
-                text_pages.append(" ".join(sheet_text))
-        return text_pages
+        import openpyxl
+
+        # Read-only mode streams the sheet XML instead of building every cell object
+        wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+        try:
+            for sheet in wb.worksheets:
+                # One join over all cells of the sheet instead of joining every row first.
+                # str.join builds a list from any iterable anyway, so a list comprehension
+                # beats join(map(str, <generator>)) here; filter(None, row) would drop 0 values
+                sheet_text = " ".join([str(cell) for row in sheet.iter_rows(values_only=True)
+                                       for cell in row if cell is not None])
+                if sheet_text.strip():
+                    yield sheet_text
+        finally:
+            # Read-only workbooks keep the file open until closed
+            wb.close()
     except Exception as e:
-        print(f"{Fore.RED}Error reading Excel {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+        logger.error("Error reading Excel %s: %s", file_path.name, e)
+
+
+def _pptx_slide_parts(archive: zipfile.ZipFile) -> list:
+    """Get the zip entry names of all slides of a PPTX package in presentation order."""
+    relationships = _parse_xml_part(archive, 'ppt/_rels/presentation.xml.rels')
+    targets = {relationship.get('Id'): relationship.get('Target')
+               for relationship in relationships.iter(_RELATIONSHIP)}
+    parts = []
+    for slide_id in _parse_xml_part(archive, 'ppt/presentation.xml').iter(_P + 'sldId'):
+        target = targets.get(slide_id.get(_R_ID))
+        if target:
+            # Targets are relative to ppt/, or absolute within the package
+            parts.append(target.lstrip('/') if target.startswith('/')
+                         else posixpath.normpath(posixpath.join('ppt', target)))
+    return parts
 
 
 def extract_text_from_pptx(file_path: Path):
-    """Extract text from PPTX/PPT files."""
+    """Extract text from PPTX/PPT files, yielding one page per slide.
+
+    Reads the a:t text nodes of each slide part with lxml instead of
+    building python-pptx shape objects.
+    """
     try:
-        prs = Presentation(file_path)
-        text_pages = []
-        for slide in prs.slides:
-            slide_text = []
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    slide_text.append(shape.text)
-            if slide_text:
-                text_pages.append(" ".join(slide_text))
-        return text_pages
+        with zipfile.ZipFile(file_path) as archive:
+            for part in _pptx_slide_parts(archive):
+                root = _parse_xml_part(archive, part)
+                slide_text = _xml_part_text(root, _A + 'p', _A + 't', (_A + 'br',))
+                if slide_text.strip():
+                    yield slide_text
     except Exception as e:
-        print(f"{Fore.RED}Error reading PowerPoint {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+        logger.error("Error reading PowerPoint %s: %s", file_path.name, e)
 
 
 def extract_text_from_rtf(file_path: Path):
-    """Extract text from RTF files."""
+    """Extract text from RTF files, scanning files without an RTF header as plain text."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            rtf_content = f.read()
-            text = rtf_to_text(rtf_content)
-            return [text] if text.strip() else []
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if data.startswith(b'{\\rtf'):
+            text = rtf_to_text(data.decode('utf-8', 'ignore'))
+        else:
+            # Renamed plain text or HTML - the pure-Python RTF parser is slow and would find nothing
+            text = _decode_text(data)
+        return [text] if text.strip() else []
     except Exception as e:
-        print(f"{Fore.RED}Error reading RTF {file_path.name}: {e}{Style.RESET_ALL}")
+        logger.error("Error reading RTF %s: %s", file_path.name, e)
         return []
 
 
+def _extract_pdf_with_pdfplumber(file_path: Path) -> list:
+    """Extract the page texts of a PDF with pdfplumber (optional dependency)."""
+    import pdfplumber
+
+    pages = []
+    with suppress_warnings_and_stderr(), pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ''
+            # Drop the page's cached layout objects before the next one
+            page.close()
+            if text.strip():
+                pages.append(text)
+    return pages
+
+
 def extract_text_from_pdf(file_path: Path):
-    """Extract text from PDF files."""
+    """Extract text from PDF files, yielding one page at a time.
+
+    Uses PDFium's native text extraction instead of building pdfplumber's
+    per-character layout objects. Documents PDFium cannot open are retried
+    with pdfplumber's more lenient parser when it is installed.
+    """
     try:
-        text_pages = []
-        with suppress_warnings_and_stderr():
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    if text.strip():
-                        text_pages.append(text)
-        return text_pages
+        import pypdfium2 as pdfium
+
+        try:
+            pdf = pdfium.PdfDocument(file_path)
+        except pdfium.PdfiumError as pdfium_error:
+            try:
+                pages = _extract_pdf_with_pdfplumber(file_path)
+            except Exception:
+                # pdfplumber is not installed or cannot read it either, report PDFium's error
+                raise pdfium_error from None
+            yield from pages
+            return
+        try:
+            for page in pdf:
+                # Release every page right away to keep memory flat on long documents
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                if text.strip():
+                    yield text
+        finally:
+            pdf.close()
     except Exception as e:
-        print(f"{Fore.RED}Error reading PDF {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+        logger.error("Error reading PDF %s: %s", file_path.name, e)
+
+
+def _decode_text(data) -> str:
+    """Decode the bytes of a text file (bytes or a memoryview).
+
+    A byte order mark selects its UTF codec, otherwise UTF-8 is tried and the
+    code page only detected when the data is not valid UTF-8.
+    """
+    head = bytes(data[:4])
+    for bom, encoding in _BYTE_ORDER_MARKS:
+        if head.startswith(bom):
+            return str(data, encoding, 'replace')
+    try:
+        return str(data, 'utf-8')
+    except UnicodeDecodeError:
+        # Not UTF-8 - detect the code page (e.g. cp1250 for Czech) instead of guessing
+        import charset_normalizer
+
+        data = bytes(data)
+        best = charset_normalizer.from_bytes(data).best()
+        return str(best) if best is not None else data.decode('latin-1')
 
 
 def extract_text_from_txt(file_path: Path):
     """Extract text from TXT files."""
     try:
-        # Try multiple encodings
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    text = f.read()
-                    return [text] if text.strip() else []
-            except UnicodeDecodeError:
-                continue
-        # If all encodings fail, try with errors='ignore'
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            text = f.read()
-            return [text] if text.strip() else []
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+                text = _decode_text(f.read())
+            else:
+                # Decode large files straight from the page cache, without a bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        text = _decode_text(view)
+        return [text] if text.strip() else []
     except Exception as e:
-        print(f"{Fore.RED}Error reading TXT {file_path.name}: {e}{Style.RESET_ALL}")
+        logger.error("Error reading TXT %s: %s", file_path.name, e)
         return []
 
 
+def _notebook_text(value) -> str:
+    """Get a notebook source or output text, which is either a string or a list of lines."""
+    return value if isinstance(value, str) else ''.join(value)
+
+
 def extract_text_from_ipynb(file_path: Path):
-    """Extract text from Jupyter Notebook (.ipynb) files."""
+    """Extract text from Jupyter Notebook (.ipynb) files, yielding a single page."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        try:
+            notebook = orjson.loads(data) if orjson is not None else json.loads(data)
+        except json.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which notebook outputs may contain
+            notebook = json.loads(data)
+
+        # One pass over cells and their outputs, written into a single buffer
+        buffer = io.StringIO()
+        for cell in notebook.get('cells', []):
+            buffer.write(_notebook_text(cell.get('source', '')))
+            buffer.write(' ')
+
+            # Also extract text/plain outputs and data of code cells
+            if cell.get('cell_type') == 'code':
+                for output in cell.get('outputs', []):
+                    buffer.write(_notebook_text(output.get('text', '')))
+                    buffer.write(' ')
+                    buffer.write(_notebook_text(output.get('data', {}).get('text/plain', '')))
+                    buffer.write(' ')
+
+        text = buffer.getvalue()
+        if text.strip():
+            yield text
+    except Exception as e:
+        logger.error("Error reading Jupyter Notebook %s: %s", file_path.name, e)
 
-        text_content = []
 
-        # Extract cells from notebook
-        cells = notebook.get('cells', [])
-        for cell in cells:
-            cell_type = cell.get('cell_type', '')
-            source = cell.get('source', [])
+def _odf_body(file_path: Path):
+    """Parse content.xml of an OpenDocument file and get its office:body element."""
+    with zipfile.ZipFile(file_path) as archive:
+        root = _parse_xml_part(archive, 'content.xml')
+    body = root.find(_ODF_OFFICE + 'body')
+    if body is None:
+        raise ValueError("content.xml has no office:body")
+    return body
 
-            # Convert source to string if it's a list
-            if isinstance(source, list):
-                cell_text = ''.join(source)
-            else:
-                cell_text = source
-
-            if cell_text.strip():
-                text_content.append(cell_text)
-
-            # Also extract outputs from code cells
-            if cell_type == 'code':
-                outputs = cell.get('outputs', [])
-                for output in outputs:
-                    # Extract text/plain outputs
-                    if 'text' in output:
-                        output_text = output['text']
-                        if isinstance(output_text, list):
-                            output_text = ''.join(output_text)
-                        if output_text.strip():
-                            text_content.append(output_text)
-
-                    # Extract data outputs
-                    if 'data' in output:
-                        data = output['data']
-                        if 'text/plain' in data:
-                            data_text = data['text/plain']
-                            if isinstance(data_text, list):
-                                data_text = ''.join(data_text)
-                            if data_text.strip():
-                                text_content.append(data_text)
-
-        return [' '.join(text_content)] if text_content else []
-    except Exception as e:
-        print(f"{Fore.RED}Error reading Jupyter Notebook {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+
+def _odf_text(root) -> str:
+    """Get all text below an ODF element, like odfpy's teletype.extractText.
+
+    Text nodes and tails are collected in document order in one walk, with a
+    space for every paragraph, heading, text:s, tab and line break.
+    """
+    from lxml import etree
+
+    pieces = []
+    for event, element in etree.iterwalk(root, events=('start', 'end')):
+        if event == 'start':
+            if element.tag in _ODF_SEPARATORS:
+                pieces.append(" ")
+            if element.text:
+                pieces.append(element.text)
+        elif element.tail and element is not root:
+            pieces.append(element.tail)
+    return "".join(pieces)
 
 
 def extract_text_from_odt(file_path: Path):
-    """Extract text from ODT (OpenDocument Text) files."""
+    """Extract text from ODT (OpenDocument Text) files, yielding a single page."""
     try:
-        doc = odf_load(file_path)
-        all_paragraphs = doc.getElementsByType(text.P)
-        text_content = []
-        for para in all_paragraphs:
-            para_text = teletype.extractText(para)
-            if para_text.strip():
-                text_content.append(para_text)
-        return [" ".join(text_content)] if text_content else []
+        text = _odf_text(_odf_body(file_path))
+        if text.strip():
+            yield text
     except Exception as e:
-        print(f"{Fore.RED}Error reading ODT {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+        logger.error("Error reading ODT %s: %s", file_path.name, e)
 
 
 def extract_text_from_ods(file_path: Path):
-    """Extract text from ODS (OpenDocument Spreadsheet) files."""
+    """Extract text from ODS (OpenDocument Spreadsheet) files, yielding one page per table."""
     try:
-        doc = odf_load(file_path)
-        tables = doc.getElementsByType(Table)
-        text_pages = []
-
-        for table in tables:
-            sheet_text = []
-            rows = table.getElementsByType(TableRow)
-            for row in rows:
-                cells = row.getElementsByType(TableCell)
-                row_text = []
-                for cell in cells:
-                    cell_text = teletype.extractText(cell)
-                    if cell_text.strip():
-                        row_text.append(cell_text)
-                if row_text:
-                    sheet_text.append(" ".join(row_text))
-            if sheet_text:
-                text_pages.append(" ".join(sheet_text))
-        return text_pages
+        for table in _odf_body(file_path).iter(_ODF_TABLE + 'table'):
+            sheet_text = _odf_text(table)
+            if sheet_text.strip():
+                yield sheet_text
     except Exception as e:
-        print(f"{Fore.RED}Error reading ODS {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
+        logger.error("Error reading ODS %s: %s", file_path.name, e)
 
 
 def extract_text_from_odp(file_path: Path):
-    """Extract text from ODP (OpenDocument Presentation) files."""
+    """Extract text from ODP (OpenDocument Presentation) files, yielding one page per slide."""
     try:
-        doc = odf_load(file_path)
-        all_paragraphs = doc.getElementsByType(text.P)
-
-        # Group text by frames (slides)
-        frames = doc.getElementsByType(Frame)
-        text_pages = []
-
-        if frames:
-            # Extract text from each frame
-            for frame in frames:
-                frame_paragraphs = frame.getElementsByType(text.P)
-                slide_text = []
-                for para in frame_paragraphs:
-                    para_text = teletype.extractText(para)
-                    if para_text.strip():
-                        slide_text.append(para_text)
-                if slide_text:
-                    text_pages.append(" ".join(slide_text))
-        else:
-            # Fallback: extract all paragraphs
-            slide_text = []
-            for para in all_paragraphs:
-                para_text = teletype.extractText(para)
-                if para_text.strip():
-                    slide_text.append(para_text)
-            if slide_text:
-                text_pages.append(" ".join(slide_text))
-
-        return text_pages
+        body = _odf_body(file_path)
+        slides = list(body.iter(_ODF_DRAW + 'page'))
+
+        # Fallback: extract the whole body when there are no draw:page slides
+        for slide in slides or [body]:
+            slide_text = _odf_text(slide)
+            if slide_text.strip():
+                yield slide_text
     except Exception as e:
-        print(f"{Fore.RED}Error reading ODP {file_path.name}: {e}{Style.RESET_ALL}")
-        return []
-
+        logger.error("Error reading ODP %s: %s", file_path.name, e)
 
-def extract_text_from_file(file_path: Path):
-    """Extract text from any supported file format."""
-    extension = file_path.suffix.lower()
 
+# Extractor of every supported extension, so dispatching a file is a single dict lookup
+_EXTRACTORS = {
+    # All code and config files are treated as text files
+    **dict.fromkeys(TEXT_EXTENSIONS, extract_text_from_txt),
     # Binary document formats
-    if extension == '.pdf':
-        return extract_text_from_pdf(file_path)
-    elif extension in ['.docx', '.doc']:
-        return extract_text_from_docx(file_path)
-    elif extension in ['.xlsx', '.xls']:
-        return extract_text_from_xlsx(file_path)
-    elif extension in ['.pptx', '.ppt']:
-        return extract_text_from_pptx(file_path)
-    elif extension == '.rtf':
-        return extract_text_from_rtf(file_path)
-    elif extension == '.odt':
-        return extract_text_from_odt(file_path)
-    elif extension == '.ods':
-        return extract_text_from_ods(file_path)
-    elif extension == '.odp':
-        return extract_text_from_odp(file_path)
-
+    '.pdf': extract_text_from_pdf,
+    '.docx': extract_text_from_docx,
+    '.doc': extract_text_from_docx,
+    '.xlsx': extract_text_from_xlsx,
+    '.xls': extract_text_from_xlsx,
+    '.pptx': extract_text_from_pptx,
+    '.ppt': extract_text_from_pptx,
+    '.rtf': extract_text_from_rtf,
+    '.odt': extract_text_from_odt,
+    '.ods': extract_text_from_ods,
+    '.odp': extract_text_from_odp,
     # Jupyter Notebooks (special JSON format)
-    elif extension == '.ipynb':
-        return extract_text_from_ipynb(file_path)
-
-    # Text-based formats (programming, config, markup files)
-    # All code and config files are treated as text files
-    elif extension in [
-        '.txt', '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', '.hpp',
-        '.cs', '.php', '.rb', '.go', '.rs', '.swift', '.kt', '.scala', '.r', '.m', '.lua',
-        '.pl', '.sh', '.bash', '.zsh', '.fish', '.ps1', '.html', '.htm', '.css', '.scss',
-        '.sass', '.less', '.vue', '.svelte', '.json', '.yaml', '.yml', '.toml', '.ini',
-        '.cfg', '.conf', '.config', '.properties', '.env', '.xml', '.md', '.markdown',
-        '.rst', '.tex', '.csv', '.tsv', '.gradle', '.maven', '.sbt', '.rake', '.make',
-        '.cmake', '.dockerfile', '.dockerignore', '.containerfile', '.gitlab-ci.yml',
-        '.travis.yml', '.circleci', '.gitignore', '.gitattributes', '.editorconfig',
-        '.htaccess', '.npmrc', '.babelrc', '.eslintrc', '.prettierrc', '.stylelintrc',
-        '.jshintrc', '.ansible', '.terraform', '.tf', '.tfvars'
-    ]:
-        return extract_text_from_txt(file_path)
-    else:
-        return []
+    '.ipynb': extract_text_from_ipynb,
+}
+# Keyed by the interned extension strings that file_extension returns
+_EXTRACTORS = {sys.intern(extension): extractor for extension, extractor in _EXTRACTORS.items()}
+
+
+# Parser modules imported by the extractor of each document format
+_PARSER_MODULES = {
+    '.pdf': ('pypdfium2',),
+    '.docx': ('lxml.etree',),
+    '.doc': ('lxml.etree',),
+    '.xlsx': ('openpyxl',),
+    '.xls': ('openpyxl',),
+    '.pptx': ('lxml.etree',),
+    '.ppt': ('lxml.etree',),
+    '.odt': ('lxml.etree',),
+    '.ods': ('lxml.etree',),
+    '.odp': ('lxml.etree',),
+}
+
+
+def preload_parsers(extensions):
+    """Import the parser modules used for files with the given extensions.
+
+    The extractors import their parsers lazily; preloading them once when a
+    worker process starts (or in the parent before workers are forked) keeps
+    that import time out of the first files of every worker.
+    """
+    modules = {module for extension in extensions for module in _PARSER_MODULES.get(extension, ())}
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            # Reported by the extractor when a file of this format is read
+            pass
+
+
+def extract_text_from_file(file_path: Path, extension: str = None):
+    """Extract text from any supported file format.
+
+    Pass extension when the caller already has it (see file_extension).
+    Returns an iterable of page texts, which may be a generator that
+    extracts each page only when the scanner reaches it.
+    """
+    if extension is None:
+        extension = file_extension(file_path.name)
+
+    extractor = _EXTRACTORS.get(extension)
+    return extractor(file_path) if extractor is not None else []
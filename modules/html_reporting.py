@@ -1,6 +1,8 @@
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List, Any
 import html
 
@@ -786,7 +788,7 @@ def _generate_file_types_section(file_types: Dict[str, int], report_lang: str) -
         return ""
 
     # Sort by count descending
-    sorted_types = sorted(file_types.items(), key=lambda x: x[1], reverse=True)
+    sorted_types = sorted(file_types.items(), key=itemgetter(1), reverse=True)
 
     badges_html = []
     for ext, count in sorted_types:
@@ -861,7 +863,7 @@ def _generate_categories_overview(global_stats: Dict[str, Dict[str, int]], repor
         unique_count = len(words)
 
         # Get top 3 words
-        top_words = sorted(words.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_words = nlargest(3, words.items(), key=itemgetter(1))
         top_words_html = " ".join([
             f'<span class="term-badge"><span class="term-word">{escape_html(word)}</span><span class="term-count">{count}</span></span>'
             for word, count in top_words
@@ -992,8 +994,8 @@ def _generate_file_findings(results: Dict[str, Dict[str, Any]], report_lang: str
         matches_html = []
         for word in sorted(words_dict.keys()):
             data = words_dict[word]
-            pages = sorted(set(data['pages']))
-            pages_str = ", ".join(map(str, pages))
+            # Pages are recorded once each, in page order
+            pages_str = ", ".join(map(str, data['pages']))
             count = len(data['pages'])
 
             # Get context
@@ -0,0 +1,308 @@
+"""
+Compiled matchers for the sensitive word lists.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import sys
+from operator import itemgetter
+from pathlib import Path
+
+import ahocorasick
+
+from .cache import default_cache_path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+    _HYPERSCAN_ERRORS = (hyperscan.error,)
+except ImportError:
+    hyperscan = None
+    _HYPERSCAN_ERRORS = ()
+
+
+def read_sensitive_words(json_path: Path, size: int = None) -> dict:
+    """Read a sensitive words JSON file into a {category: [words]} dict.
+
+    The file is memory-mapped and parsed with orjson straight from the page
+    cache when orjson is installed, falling back to the stdlib json module.
+    Categories and words are interned, so every result dict and automaton
+    entry shares one str object per word.
+    """
+    if size is None:
+        size = json_path.stat().st_size
+    if size == 0:
+        # mmap cannot map an empty file
+        return {}
+
+    with open(json_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if orjson is not None:
+            with memoryview(mm) as view:
+                data = orjson.loads(view)
+        else:
+            data = json.loads(mm[:].decode("utf-8"))
+
+    return {sys.intern(category): [sys.intern(word) for word in words]
+            for category, words in data.items()}
+
+
+class HyperscanMatcher:
+    """Hyperscan database over the automaton keys of a word list.
+
+    Provides the part of the pyahocorasick Automaton interface used by
+    find_automaton_matches (kind and iter), so both engines share the same
+    case folding and word boundary checks. Keys are compiled as literals,
+    case folding is left to find_automaton_matches.
+    """
+
+    def __init__(self, keys: dict):
+        self._values = list(keys.values())
+        self.kind = ahocorasick.AHOCORASICK if keys else ahocorasick.EMPTY
+        self._database = None
+        if keys:
+            # Byte escapes keep every key a literal, whatever characters it holds
+            expressions = ["".join(f"\\x{byte:02x}" for byte in key.encode("utf-8")).encode("ascii")
+                           for key in keys]
+            self._database = hyperscan.Database()
+            self._database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                                   elements=len(expressions), flags=[0] * len(expressions))
+
+    def __getstate__(self):
+        database = hyperscan.dumpb(self._database) if self._database is not None else None
+        return {'values': self._values, 'kind': self.kind, 'database': database}
+
+    def __setstate__(self, state):
+        self._values = state['values']
+        self.kind = state['kind']
+        self._database = None
+        if state['database'] is not None:
+            self._database = hyperscan.loadb(state['database'], hyperscan.HS_MODE_BLOCK)
+            self._database.scratch = hyperscan.Scratch(self._database)
+
+    def iter(self, haystack: str):
+        """Yield (last_index, value) for every key occurring in haystack."""
+        data = haystack.encode("utf-8", "surrogatepass")
+        hits = []
+        self._database.scan(data, match_event_handler=_collect_hyperscan_hit, context=hits)
+        # Hyperscan reports hits by end offset already, so this stable sort is a linear pass
+        hits.sort(key=_hit_end)
+
+        if len(data) == len(haystack):
+            # ASCII text - byte offsets are character offsets
+            for pattern_id, end in hits:
+                yield end - 1, self._values[pattern_id]
+            return
+
+        # Literal UTF-8 keys always end on a character boundary, so byte offsets
+        # can be turned into character offsets by decoding the gaps between them
+        char_end = byte_end = 0
+        for pattern_id, end in hits:
+            char_end += len(data[byte_end:end].decode("utf-8", "surrogatepass"))
+            byte_end = end
+            yield char_end - 1, self._values[pattern_id]
+
+    def save(self, path: str, serializer):
+        """Save the matcher to a file (same signature as Automaton.save)."""
+        with open(path, "wb") as f:
+            f.write(serializer(self))
+
+
+# End offset of a collected (pattern id, end offset) Hyperscan hit
+_hit_end = itemgetter(1)
+
+
+def _collect_hyperscan_hit(pattern_id, start, end, flags, hits):
+    """Hyperscan match callback collecting (pattern id, end offset) pairs."""
+    hits.append((pattern_id, end))
+
+
+def _load_hyperscan_matcher(path: str, deserializer):
+    """Load a matcher saved by HyperscanMatcher.save."""
+    with open(path, "rb") as f:
+        return deserializer(f.read())
+
+
+def _automaton_keys(data: dict, case_sensitive: bool = False) -> dict:
+    """Map every (case folded) word to its length and (order, category, word) entries.
+
+    Bump AUTOMATON_FORMAT when changing this layout, cached automata store it.
+    """
+    keys = {}
+    order = 0
+    for category, words in data.items():
+        for word in words:
+            key = word if case_sensitive else word.lower()
+            if not key:
+                continue
+            # The same word may be listed in several categories, keep them all
+            _, entries = keys.get(key, (len(key), ()))
+            keys[key] = (len(key), entries + ((order, category, word),))
+            order += 1
+    return keys
+
+
+def build_automaton(data: dict, case_sensitive: bool = False, engine: str = "ahocorasick"):
+    """Build one automaton over the words of all categories.
+
+    engine is 'ahocorasick' for a pyahocorasick Automaton, or 'hyperscan'
+    for a HyperscanMatcher (requires the optional hyperscan package).
+    """
+    keys = _automaton_keys(data, case_sensitive=case_sensitive)
+    if engine == "hyperscan":
+        return HyperscanMatcher(keys)
+
+    automaton = ahocorasick.Automaton()
+    for key, value in keys.items():
+        automaton.add_word(key, value)
+    automaton.make_automaton()
+    return automaton
+
+
+# Cache file suffix and loader of each automaton engine
+ENGINES = {
+    'ahocorasick': ('.ac', ahocorasick.load),
+    'hyperscan': ('.hs', _load_hyperscan_matcher),
+}
+
+
+def resolve_engine(engine: str = "auto") -> str:
+    """Resolve 'auto' to the fastest installed automaton engine."""
+    if engine == "auto":
+        return "hyperscan" if hyperscan is not None else "ahocorasick"
+    if engine == "hyperscan" and hyperscan is None:
+        raise ImportError("The hyperscan engine requires: pip install hyperscan")
+    return engine
+
+
+# Layout of the cached automaton values (see _automaton_keys), bump it whenever they change
+# so caches written by other versions are never unpickled into the wrong shape
+AUTOMATON_FORMAT = 1
+
+
+def automaton_cache_path(json_path: Path, case_sensitive: bool = False, engine: str = "ahocorasick") -> Path:
+    """Get the on-disk cache location of the automaton built from a word list."""
+    suffix, _ = ENGINES[engine]
+    # Case-sensitive and case-insensitive automata use different keys
+    return json_path.with_suffix(f".v{AUTOMATON_FORMAT}" + (".cs" + suffix if case_sensitive else suffix))
+
+
+def _user_automaton_cache_path(json_path: Path, case_sensitive: bool = False, engine: str = "ahocorasick") -> Path:
+    """Get the fallback cache location in the user cache directory, for word lists in read-only folders."""
+    cache_path = automaton_cache_path(json_path, case_sensitive, engine)
+    # Word lists of the same name in different folders get their own automaton
+    digest = hashlib.sha1(os.path.abspath(json_path).encode("utf-8", "surrogatepass")).hexdigest()[:12]
+    return default_cache_path().with_name(f"{cache_path.stem}-{digest}{cache_path.suffix}")
+
+
+# Automata already loaded by this process, keyed by word list path, version and options
+_loaded_automata = {}
+
+
+def load_automaton(json_path: Path, case_sensitive: bool = False, json_stat: os.stat_result = None,
+                   engine: str = "ahocorasick"):
+    """Load the automaton for a word list, rebuilding its cache when the JSON is newer.
+
+    Pass json_stat when the caller has already stat'ed json_path. Repeated
+    calls for an unchanged word list return the automaton loaded first.
+    """
+    if json_stat is None:
+        json_stat = json_path.stat()
+    key = (os.path.abspath(json_path), json_stat.st_mtime_ns, json_stat.st_size, case_sensitive, engine)
+    automaton = _loaded_automata.get(key)
+    if automaton is None:
+        automaton = _loaded_automata[key] = _load_automaton(json_path, case_sensitive, json_stat, engine)
+    return automaton
+
+
+def _load_automaton(json_path: Path, case_sensitive: bool, json_stat: os.stat_result, engine: str):
+    """Load the automaton from its on-disk cache or build it from the word list.
+
+    The cache is kept next to the word list, or in the user cache directory
+    when the word list's folder is read-only.
+    """
+    _, load = ENGINES[engine]
+    cache_paths = (automaton_cache_path(json_path, case_sensitive, engine),
+                   _user_automaton_cache_path(json_path, case_sensitive, engine))
+    for cache_path in cache_paths:
+        try:
+            if cache_path.stat().st_mtime >= json_stat.st_mtime:
+                return load(str(cache_path), pickle.loads)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) + _HYPERSCAN_ERRORS:
+            # Missing or corrupt cache, or a database compiled for another platform - rebuild it below
+            pass
+
+    data = read_sensitive_words(json_path, size=json_stat.st_size)
+    automaton = build_automaton(data, case_sensitive=case_sensitive, engine=engine)
+
+    for cache_path in cache_paths:
+        # Write to a temporary file first so concurrent runs never read a partial cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            automaton.save(str(tmp_path), pickle.dumps)
+            os.replace(tmp_path, cache_path)
+            break
+        except OSError:
+            # Read-only location - try the next one, the scan can still use the freshly built automaton
+            tmp_path.unlink(missing_ok=True)
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a word character for regex \\b."""
+    return char.isalnum() or char == '_'
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Check whether a regex \\b would match at the given position of text."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _fold_case(text: str) -> str:
+    """Lower-case text while keeping every character at its original offset."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. 'İ') lower-case to several code points,
+    # keep those as they are so match offsets still line up with text
+    return "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+def find_automaton_matches(automaton, text: str, case_sensitive: bool = False):
+    """Find the first whole-word match of each sensitive word in text.
+
+    automaton is a pyahocorasick Automaton or a HyperscanMatcher.
+
+    Returns (category, word, start, end) tuples in word list order, where
+    word is the word list spelling of the matched text.
+    """
+    if automaton.kind != ahocorasick.AHOCORASICK:
+        # Empty word list
+        return []
+
+    haystack = text if case_sensitive else _fold_case(text)
+    first_matches = {}
+    for last_index, (length, entries) in automaton.iter(haystack):
+        if entries[0] in first_matches:
+            # All entries of a key are recorded together, skip its later occurrences
+            # before paying for the word boundary checks
+            continue
+        end = last_index + 1
+        start = end - length
+        # Same whole-word semantics as the r'\b...\b' regex patterns
+        if not (_is_word_boundary(text, start) and _is_word_boundary(text, end)):
+            continue
+        for entry in entries:
+            first_matches[entry] = (start, end)
+
+    return [(category, word, start, end)
+            for (_, category, word), (start, end) in sorted(first_matches.items())]
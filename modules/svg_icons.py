@@ -3,6 +3,8 @@ SVG icons for Docs X-Ray HTML reports.
 Icons can be found at: https://icon-sets.iconify.design/
 """
 
+from functools import lru_cache
+
 # Category icons - using Material Design Icons and other icon sets
 CATEGORY_ICONS = {
     'health': '''<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24"><path fill="currentColor" d="M9.616 20.846q-.667 0-1.141-.474Q8 19.897 8 19.23V16H4.77q-.667 0-1.142-.475q-.474-.474-.474-1.14V12.5h5.565l1.854 2.78q.068.105.168.162t.232.058q.173 0 .304-.094t.192-.26l1.677-5.03l1.427 2.146q.076.106.189.172T15 12.5h5.846v1.885q0 .666-.474 1.14q-.475.475-1.141.475H16v3.23q0 .667-.475 1.142q-.474.474-1.14.474zm1.238-6.961l-1.452-2.166q-.067-.104-.167-.161T9 11.5H3.154V9.616q0-.667.474-1.141Q4.103 8 4.77 8H8V4.77q0-.667.475-1.142q.474-.474 1.14-.474h4.77q.666 0 1.14.474Q16 4.103 16 4.77V8h3.23q.667 0 1.142.475q.474.474.474 1.14V11.5h-5.59L13.42 8.72q-.064-.098-.18-.159t-.245-.061q-.167 0-.285.094t-.18.26z"/></svg>''',
@@ -29,21 +31,24 @@ CATEGORY_ICONS = {
 }
 
 
-def get_category_icon(category: str, size: int = 24, color: str = 'currentColor') -> str:
-    """Get SVG icon for a category"""
-    # Get icon from dict, fallback to default if not found
-    icon = CATEGORY_ICONS.get(category.lower(), CATEGORY_ICONS['default'])
+def _icon_template(svg_code: str, default_size: int) -> str:
+    """Turn an SVG icon into a str.format template with {size} and {color} fields."""
+    template = svg_code.replace('{', '{{').replace('}', '}}')
+    template = template.replace(f'width="{default_size}"', 'width="{size}"')
+    template = template.replace(f'height="{default_size}"', 'height="{size}"')
+    return template.replace('fill="currentColor"', 'fill="{color}"')
 
-    # Adjust size if different from default 24
-    if size != 24:
-        icon = icon.replace('width="24"', f'width="{size}"')
-        icon = icon.replace('height="24"', f'height="{size}"')
 
-    # Adjust color if different from default
-    if color != 'currentColor':
-        icon = icon.replace('fill="currentColor"', f'fill="{color}"')
+# Category icon templates, prepared once instead of replacing size and color on every call
+_CATEGORY_TEMPLATES = {category: _icon_template(icon, 24) for category, icon in CATEGORY_ICONS.items()}
 
-    return icon
+
+@lru_cache(maxsize=256)
+def get_category_icon(category: str, size: int = 24, color: str = 'currentColor') -> str:
+    """Get SVG icon for a category"""
+    # Get template from dict, fallback to default if not found
+    template = _CATEGORY_TEMPLATES.get(category.lower(), _CATEGORY_TEMPLATES['default'])
+    return template.format(size=size, color=color)
 
 
 def get_all_categories() -> list:
@@ -53,7 +58,11 @@ def get_all_categories() -> list:
 
 def add_custom_icon(category: str, svg_code: str) -> None:
     """Add a custom SVG icon for a category."""
-    CATEGORY_ICONS[category.lower()] = svg_code
+    # Keys are stored lower-cased, lookups only lower-case on icon cache misses
+    key = category.lower()
+    CATEGORY_ICONS[key] = svg_code
+    _CATEGORY_TEMPLATES[key] = _icon_template(svg_code, 24)
+    get_category_icon.cache_clear()
 
 
 # Status/UI icons
@@ -70,13 +79,12 @@ STATUS_ICONS = {
 }
 
 
-def get_status_icon(status: str, size: int = 20) -> str:
-    """Get status/UI icon"""
-    icon = STATUS_ICONS.get(status.lower(), STATUS_ICONS['info'])
+# Status icon templates, prepared once like the category templates
+_STATUS_TEMPLATES = {status: _icon_template(icon, 20) for status, icon in STATUS_ICONS.items()}
 
-    # Adjust size if different from default 20
-    if size != 20:
-        icon = icon.replace('width="20"', f'width="{size}"')
-        icon = icon.replace('height="20"', f'height="{size}"')
 
-    return icon
+@lru_cache(maxsize=64)
+def get_status_icon(status: str, size: int = 20) -> str:
+    """Get status/UI icon"""
+    template = _STATUS_TEMPLATES.get(status.lower(), _STATUS_TEMPLATES['info'])
+    return template.format(size=size, color='currentColor')
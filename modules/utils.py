@@ -1,9 +1,76 @@
 """Utility functions for Docs X-Ray."""
 
+import logging
+import os
 import sys
 import warnings
 from contextlib import contextmanager
 from io import StringIO
+from operator import itemgetter
+from types import SimpleNamespace
+
+
+# SGR parameters of the colorama Fore/Style codes used for console output
+_BASE_COLORS = ('BLACK', 'RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE')
+_ANSI_CODES = {
+    **{color: 30 + index for index, color in enumerate(_BASE_COLORS)},
+    **{f'LIGHT{color}_EX': 90 + index for index, color in enumerate(_BASE_COLORS)},
+    'RESET': 39, 'BRIGHT': 1, 'DIM': 2, 'NORMAL': 22, 'RESET_ALL': 0,
+}
+
+
+def setup_color():
+    """Get the console color codes as one namespace (C.RED, C.BRIGHT, C.RESET_ALL, ...).
+
+    Every code is an empty string when stdout is not a terminal or NO_COLOR
+    is set. Terminals get raw ANSI escape codes, colorama is only imported
+    and initialized on Windows, whose legacy console needs its translation.
+    """
+    if sys.stdout is None or not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        return SimpleNamespace(**dict.fromkeys(_ANSI_CODES, ""))
+
+    if sys.platform != 'win32':
+        return SimpleNamespace(**{name: f"\x1b[{code}m" for name, code in _ANSI_CODES.items()})
+
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+    return SimpleNamespace(**vars(Fore), **vars(Style))
+
+
+C = setup_color()
+
+
+class _ConsoleHandler(logging.Handler):
+    """Write colored log messages to the current sys.stdout.
+
+    sys.stdout is looked up for every message, so messages logged while a
+    worker redirects stdout end up in that file's buffered output.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._colors = {logging.ERROR: C.RED, logging.WARNING: C.YELLOW}
+
+    def emit(self, record):
+        try:
+            color = self._colors.get(record.levelno, "")
+            sys.stdout.write(f"{color}{self.format(record)}{C.RESET_ALL if color else ''}\n")
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging() -> logging.Logger:
+    """Send the messages of all Docs X-Ray loggers (logging.getLogger(__name__)) to the console.
+
+    Called by the command-line entry point and in every scan worker process;
+    programs importing the package keep their own logging configuration.
+    """
+    logger = logging.getLogger(__package__)
+    if not logger.handlers:
+        logger.addHandler(_ConsoleHandler())
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
 
 
 @contextmanager
@@ -38,3 +105,16 @@ def suppress_pdf_warnings():
     # Suppress other common PDF warnings
     warnings.filterwarnings('ignore', category=UserWarning, module='pdfplumber')
     warnings.filterwarnings('ignore', category=DeprecationWarning, module='pdfplumber')
+
+
+def sort_statistics(stats: dict) -> list:
+    """Sort statistics by category, then by occurrences (most frequent first).
+
+    Returns [(category, [(word, count), ...]), ...], computed once and shared
+    by the summary table and all exporters.
+    """
+    # itemgetter runs in C, unlike a lambda called once per word. The full descending
+    # order is needed anyway, so heapq.nlargest would not save any work
+    by_count = itemgetter(1)
+    return [(category, sorted(words.items(), key=by_count, reverse=True))
+            for category, words in sorted(stats.items())]